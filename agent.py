@@ -11,6 +11,7 @@ Reads JSON from stdin, processes with LangChain agent, outputs text response.
 """
 
 import asyncio
+import functools
 import json
 import subprocess
 import sys
@@ -19,12 +20,27 @@ import logging
 from contextlib import AsyncExitStack
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from langchain_mcp_adapters.tools import load_mcp_tools
 from tools import get_tools
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 # Configure logging for agent visibility (only when AGENT_DEBUG=true)
@@ -37,6 +53,25 @@ if os.getenv("AGENT_DEBUG", "false").lower() == "true":
 else:
     logging.disable(logging.CRITICAL)
 
+# Configuration is read once at import, after .env has been loaded
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+_SLACK_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+_SLACK_TEAM_ID = os.getenv("SLACK_TEAM_ID")
+_SLACK_CHANNEL_ID = os.getenv("SLACK_ESCALATION_CHANNEL_ID", "")
+
+
+def _check_config() -> None:
+    """Raise a single RuntimeError naming every missing required setting."""
+    required = {
+        "OPENAI_API_KEY": _OPENAI_API_KEY,
+        "SLACK_BOT_TOKEN": _SLACK_TOKEN,
+        "SLACK_TEAM_ID": _SLACK_TEAM_ID,
+        "SLACK_ESCALATION_CHANNEL_ID": _SLACK_CHANNEL_ID,
+    }
+    missing = [name for name, value in required.items() if not value]
+    if missing:
+        raise RuntimeError(f"Missing required configuration: {', '.join(missing)}")
+
 
 # System prompt that guides the agent's behavior
 SYSTEM_PROMPT = """You are a helpful and professional customer service agent for TechGear e-commerce.
@@ -51,6 +86,7 @@ Guidelines for your responses:
 - Customer ID will be provided in the message in format: [Customer ID: CUST-XXX]
 - Extract the customer ID and use it to look up customer and order information
 - Always look up customer and order information first before making decisions
+- To get a customer's details and all of their orders, use the get_customer_context tool — one call instead of lookup_customer plus get_customer_orders
 - Be empathetic and professional in your tone
 - Clearly explain business policies and decisions
 - When processing refunds, use the process_refund_request tool
@@ -60,6 +96,7 @@ Guidelines for your responses:
 - For hypothetical shipping cost quotes, use the calculate_shipping_cost tool — never guess costs
 - Always verify the customer tier before making tier-dependent decisions
 - If information cannot be found, apologize and explain what information you need
+- When multiple pieces of information are independent (e.g., order lookup and delivery estimate), issue them as parallel tool calls in a single response rather than sequentially
 
 Order cancellation workflow:
 1. Look up the order using lookup_order
@@ -93,14 +130,23 @@ Be concise but thorough in your responses. Help resolve customer issues while pr
 """
 
 
+# SYSTEM_PROMPT never changes, so its message is built once and shared
+_SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+
 def _get_slack_system_context() -> str:
     """Build additional system context with Slack configuration."""
-    channel_id = os.getenv("SLACK_ESCALATION_CHANNEL_ID", "")
-    if channel_id:
-        return f"\n\nSlack escalation channel ID: {channel_id}"
+    if _SLACK_CHANNEL_ID:
+        return f"Slack escalation channel ID: {_SLACK_CHANNEL_ID}"
     raise RuntimeError("Slack integration is not configured")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_slack_system_message() -> SystemMessage:
+    """Return the shared Slack context message (raises if Slack is not configured)."""
+    return SystemMessage(content=_get_slack_system_context())
+
+
 async def _execute_tool(tool_call: dict, tool_map: dict) -> str:
     """
     Execute a single tool call and return the result.
@@ -126,6 +172,80 @@ async def _execute_tool(tool_call: dict, tool_map: dict) -> str:
         return f"Error calling tool: {str(e)}"
 
 
+def _dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dispatch_tool(tool_call: dict, tool_map: dict) -> asyncio.Task:
+    """Log a tool call and start executing it as a background task."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("  Calling %s(%s)", tool_call["name"], _dumps(tool_call["args"]))
+    return asyncio.create_task(_execute_tool(tool_call, tool_map))
+
+
+async def _stream_response(llm_with_tools, messages: list, tool_map: dict):
+    """
+    Stream one model response, starting tool calls as soon as they are decoded.
+
+    OpenAI streams tool calls one after another, so a tool call is complete
+    once a chunk for the next one arrives; the last one completes with the
+    stream. Tool execution therefore overlaps with decoding the rest of the
+    response.
+
+    Args:
+        llm_with_tools: The LLM runnable with tools bound
+        messages: Conversation messages to send
+        tool_map: Mapping of tool names to tool functions
+
+    Returns:
+        Tuple of (aggregated response message, list of tool tasks in
+        response.tool_calls order)
+    """
+    response = None
+    started = {}
+    try:
+        async for chunk in llm_with_tools.astream(messages):
+            response = chunk if response is None else response + chunk
+            decoded = {tc["id"]: tc for tc in response.tool_calls}
+            for tool_call_chunk in response.tool_call_chunks[:-1]:
+                call_id = tool_call_chunk["id"]
+                if call_id not in started and call_id in decoded:
+                    started[call_id] = _dispatch_tool(decoded[call_id], tool_map)
+    except BaseException:
+        for task in started.values():
+            task.cancel()
+        raise
+
+    if response is None:
+        return AIMessage(content=""), []
+
+    tasks = [
+        started.pop(tc["id"], None) or _dispatch_tool(tc, tool_map)
+        for tc in response.tool_calls
+    ]
+    return response, tasks
+
+
+def _tool_result_text(result) -> str:
+    """Log a gathered tool result and return it as ToolMessage content."""
+    if isinstance(result, BaseException):
+        error_msg = f"Error: {str(result)}"
+        logger.error("  %s", error_msg)
+        return error_msg
+    logger.info("  Result: %s", result[:200])
+    return result
+
+
 def _get_slack_server_params():
     """
     Build MCP server params for Slack if configured.
@@ -133,10 +253,7 @@ def _get_slack_server_params():
     Returns:
         StdioServerParameters or None if Slack is not configured.
     """
-    slack_token = os.getenv("SLACK_BOT_TOKEN")
-    slack_team_id = os.getenv("SLACK_TEAM_ID")
-
-    if not slack_token or not slack_team_id:
+    if not _SLACK_TOKEN or not _SLACK_TEAM_ID:
         raise RuntimeError("Slack integration is not configured")
 
     return StdioServerParameters(
@@ -144,12 +261,50 @@ def _get_slack_server_params():
         args=["-y", "@modelcontextprotocol/server-slack"],
         env={
             **os.environ,
-            "SLACK_BOT_TOKEN": slack_token,
-            "SLACK_TEAM_ID": slack_team_id,
+            "SLACK_BOT_TOKEN": _SLACK_TOKEN,
+            "SLACK_TEAM_ID": _SLACK_TEAM_ID,
         },
     )
 
 
+# Maximum number of distinct tool sets to keep bound models for
+_BOUND_LLM_CACHE_SIZE = 4
+_bound_llm_cache: dict[tuple[str, ...], object] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm() -> ChatOpenAI:
+    """Return the shared ChatOpenAI client so its HTTP connection pool is reused."""
+    return ChatOpenAI(
+        model="gpt-4o",
+        temperature=0.7,
+        openai_api_key=_OPENAI_API_KEY,
+    )
+
+
+def _get_llm_with_tools(tools: list):
+    """
+    Return the shared LLM bound to the given tools.
+
+    Binding serializes every tool schema, so the result is cached per tool set
+    (keyed by tool names).
+
+    Args:
+        tools: List of LangChain tools to bind
+
+    Returns:
+        The LLM runnable with tools bound
+    """
+    key = tuple(sorted(tool.name for tool in tools))
+    llm_with_tools = _bound_llm_cache.get(key)
+    if llm_with_tools is None:
+        if len(_bound_llm_cache) >= _BOUND_LLM_CACHE_SIZE:
+            _bound_llm_cache.pop(next(iter(_bound_llm_cache)))
+        llm_with_tools = _get_llm().bind_tools(tools, parallel_tool_calls=True)
+        _bound_llm_cache[key] = llm_with_tools
+    return llm_with_tools
+
+
 async def _run_agent_loop(
     tools: list, message: str, context: dict
 ) -> tuple[str, list[str]]:
@@ -164,14 +319,8 @@ async def _run_agent_loop(
     Returns:
         Tuple of (response text, list of tool names called)
     """
-    llm = ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.7,
-        openai_api_key=os.getenv("OPENAI_API_KEY"),
-    )
-
     tool_map = {tool.name: tool for tool in tools}
-    llm_with_tools = llm.bind_tools(tools)
+    llm_with_tools = _get_llm_with_tools(tools)
     called_tools = []
 
     # Enhance message with customer context if provided
@@ -180,18 +329,20 @@ async def _run_agent_loop(
         customer_id = context["customer_id"]
         enhanced_message = f"[Customer ID: {customer_id}] {message}"
 
-    # Build system prompt with Slack context
-    full_system_prompt = SYSTEM_PROMPT + _get_slack_system_context()
-
+    # Keep SYSTEM_PROMPT as its own byte-identical message so OpenAI's prompt
+    # cache can reuse it; the Slack context follows as a separate message.
     messages = [
-        SystemMessage(content=full_system_prompt),
+        _SYSTEM_MESSAGE,
+        _get_slack_system_message(),
         HumanMessage(content=enhanced_message),
     ]
 
     max_iterations = 10
     for iteration in range(max_iterations):
         logger.info("--- Iteration %d/%d ---", iteration + 1, max_iterations)
-        response = await llm_with_tools.ainvoke(messages)
+        response, tool_tasks = await _stream_response(
+            llm_with_tools, messages, tool_map
+        )
 
         if not response.tool_calls:
             text = response.content if hasattr(response, "content") else str(response)
@@ -200,26 +351,16 @@ async def _run_agent_loop(
 
         logger.info("Agent chose %d tool(s)", len(response.tool_calls))
         messages.append(response)
+        called_tools.extend(tc["name"] for tc in response.tool_calls)
+
+        # Tool calls were started concurrently while streaming; results come
+        # back in the original tool_call order.
+        results = await asyncio.gather(*tool_tasks, return_exceptions=True)
 
-        for tool_call in response.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
-            called_tools.append(tool_name)
-
-            logger.info("  Calling %s(%s)", tool_name, json.dumps(tool_args))
-
-            try:
-                tool_result = await _execute_tool(tool_call, tool_map)
-                logger.info("  Result: %s", tool_result[:200])
-                messages.append(
-                    ToolMessage(content=tool_result, tool_call_id=tool_call["id"])
-                )
-            except Exception as e:
-                error_msg = f"Error: {str(e)}"
-                logger.error("  %s", error_msg)
-                messages.append(
-                    ToolMessage(content=error_msg, tool_call_id=tool_call["id"])
-                )
+        messages.extend(
+            ToolMessage(content=_tool_result_text(result), tool_call_id=tc["id"])
+            for tc, result in zip(response.tool_calls, results)
+        )
 
     logger.warning("Max iterations reached - returning timeout response")
     return (
@@ -250,6 +391,100 @@ async def load_all_tools(tool_interceptors=None) -> tuple[list, AsyncExitStack]:
     return tools + slack_tools, stack
 
 
+# Long-lived MCP session shared by handle_message calls on the same event loop
+_mcp_state: dict = {}
+
+
+async def _own_mcp_session(ready: asyncio.Future, stop: asyncio.Event) -> None:
+    """
+    Hold the shared MCP session open until stop is set.
+
+    The session is opened and closed in this one task, as the MCP stdio client
+    requires. The task is also cancelled, closing the session and its Slack
+    server, when asyncio.run() shuts its event loop down.
+    """
+    try:
+        tools, stack = await load_all_tools()
+    except asyncio.CancelledError:
+        ready.cancel()
+        raise
+    except Exception as e:
+        ready.set_exception(e)
+        return
+
+    async with stack:
+        ready.set_result(tools)
+        await stop.wait()
+
+
+def _stop_stale_session() -> None:
+    """Ask a session left open on another, still-running loop to close."""
+    old_loop = _mcp_state.get("loop")
+    stop = _mcp_state.get("stop")
+    if stop is not None and not old_loop.is_closed():
+        old_loop.call_soon_threadsafe(stop.set)
+
+
+async def get_all_tools() -> list:
+    """
+    Return all tools, opening the shared MCP session on first use.
+
+    The Slack MCP server is spawned once per event loop and reused for every
+    subsequent call. It is shut down by close_all_tools(), or when the loop is
+    finished by asyncio.run() / asyncio.Runner. Library callers that close
+    their event loops any other way must await close_all_tools() first, or the
+    Slack server process is left running.
+
+    Returns:
+        List of local and MCP tools
+    """
+    loop = asyncio.get_running_loop()
+    if _mcp_state.get("loop") is not loop:
+        # Sessions (and the lock) are bound to the loop that created them
+        _stop_stale_session()
+        _mcp_state.clear()
+        _mcp_state.update(loop=loop, lock=asyncio.Lock())
+
+    async with _mcp_state["lock"]:
+        if "ready" not in _mcp_state:
+            ready = loop.create_future()
+            stop = asyncio.Event()
+            task = asyncio.create_task(_own_mcp_session(ready, stop))
+            _mcp_state.update(ready=ready, stop=stop, task=task)
+
+        try:
+            # Shielded so a cancelled caller doesn't cancel the shared session
+            tools = await asyncio.shield(_mcp_state["ready"])
+        except Exception:
+            # Let the next call retry opening the session
+            for key in ("ready", "stop", "task"):
+                _mcp_state.pop(key, None)
+            raise
+
+        # Serialize the (large) MCP tool schemas once, alongside the session
+        _get_llm_with_tools(tools)
+        return tools
+
+
+async def close_all_tools() -> None:
+    """
+    Close the shared MCP session opened by get_all_tools() on this loop, if any.
+
+    Required before closing an event loop that was not run by asyncio.run() or
+    asyncio.Runner; see get_all_tools().
+    """
+    if _mcp_state.get("loop") is not asyncio.get_running_loop():
+        return
+
+    async with _mcp_state["lock"]:
+        stop = _mcp_state.pop("stop", None)
+        task = _mcp_state.pop("task", None)
+        _mcp_state.pop("ready", None)
+    if task is not None:
+        stop.set()
+        await task
+
+
 async def handle_message(
     message: str, context: dict = None, tools: list = None
 ) -> tuple[str, list[str]]:
@@ -259,7 +494,7 @@ async def handle_message(
     Args:
         message: The customer's message
         context: Optional context dict containing customer_id (e.g., {"customer_id": "CUST-001"})
-        tools: Optional pre-loaded tools list (skips MCP session setup if provided)
+        tools: Optional pre-loaded tools list (skips the shared MCP session if provided)
 
     Returns:
         Tuple of (response text, list of tool names called)
@@ -267,14 +502,10 @@ async def handle_message(
     if context is None:
         context = {}
 
-    if tools is not None:
-        return await _run_agent_loop(tools, message, context)
+    if tools is None:
+        tools = await get_all_tools()
 
-    all_tools, stack = await load_all_tools()
-    try:
-        return await _run_agent_loop(all_tools, message, context)
-    finally:
-        await stack.aclose()
+    return await _run_agent_loop(tools, message, context)
 
 
 async def async_main():
@@ -289,7 +520,8 @@ async def async_main():
     }
     """
     try:
-        input_data = json.loads(sys.stdin.read())
+        _check_config()
+        input_data = _loads(sys.stdin.buffer.read())
         message = input_data.get("message", "")
         context = input_data.get("context", {})
         if not message:
@@ -304,10 +536,17 @@ async def async_main():
         print(f"I apologize, but I'm experiencing technical difficulties: {str(e)}")
         sys.exit(1)
 
+    finally:
+        await close_all_tools()
+
 
 def main():
-    """Sync entry point that runs the async main."""
-    asyncio.run(async_main())
+    """Sync entry point that runs the async main (on uvloop when available)."""
+    if uvloop is None:
+        asyncio.run(async_main())
+        return
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(async_main())
 
 
 if __name__ == "__main__":
@@ -2,23 +2,118 @@
 SQLite database setup and management for the customer service agent.
 
 Provides schema creation, sample data seeding, and test data management.
-In test mode (AGENT_TEST_MODE=true), uses a separate test database.
+In test mode (AGENT_TEST_MODE=true), uses a separate test database, which is
+in-memory unless TEST_DB_URL points elsewhere.
 """
 
 import os
-from sqlalchemy import text
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+_engine = None
+_read_engine = None
+
+# Statement cache sized well above the handful of hot tool queries, so their
+# prepared statements are never evicted from a pooled connection
+_SQLITE_CONNECT_ARGS = {"check_same_thread": False, "cached_statements": 256}
 
 
 def get_db_url() -> str:
     """Get database URL based on test mode environment variable."""
     if os.getenv("AGENT_TEST_MODE") == "true":
-        return os.getenv("TEST_DB_URL", "sqlite:///test_agent.db")
+        return os.getenv("TEST_DB_URL", "sqlite://")
     return "sqlite:///techgear.db"
 
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    """Enable WAL journaling with relaxed fsync on each new SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def _is_memory_url(db_url: str) -> bool:
+    """Whether the URL names an in-memory SQLite database."""
+    return make_url(db_url).database in (None, "", ":memory:")
+
+
+def get_engine():
+    """
+    Get the process-wide read-write SQLAlchemy engine, creating it on first use.
+
+    Connections are pooled and kept open for the life of the process, so tool
+    calls check out an already-open SQLite connection (with WAL set up) instead
+    of reopening the database file. SQLite only allows one writer at a time, so
+    a file database gets a single pooled connection and writers queue for it
+    rather than for the database lock; reads go through get_read_engine().
+
+    An in-memory database (the test-mode default) instead uses StaticPool, so
+    every caller shares the one connection that holds the data.
+    """
+    global _engine
+    if _engine is None:
+        db_url = get_db_url()
+        if _is_memory_url(db_url):
+            # No rollback on return: it would hit the shared connection and
+            # could undo another caller's uncommitted write.
+            _engine = create_engine(
+                db_url,
+                poolclass=StaticPool,
+                pool_reset_on_return=None,
+                connect_args=_SQLITE_CONNECT_ARGS,
+            )
+        else:
+            _engine = create_engine(
+                db_url,
+                poolclass=QueuePool,
+                pool_size=1,
+                max_overflow=0,
+                pool_recycle=3600,
+                connect_args=_SQLITE_CONNECT_ARGS,
+            )
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
+    return _engine
+
+
+def _set_query_only(dbapi_conn, connection_record) -> None:
+    """Reject writes on a read-engine connection."""
+    dbapi_conn.execute("PRAGMA query_only=1")
+
+
+def get_read_engine():
+    """
+    Get the process-wide read-only SQLAlchemy engine, creating it on first use.
+
+    In WAL mode readers never block each other or the writer, so concurrent
+    read tool calls each get their own pooled connection, opened with
+    ``PRAGMA query_only=1``. Create the schema through get_engine() first.
+
+    An in-memory database has no second connection to read from, so there
+    this is the same engine as get_engine().
+    """
+    global _read_engine
+    if _read_engine is None:
+        db_url = get_db_url()
+        if _is_memory_url(db_url):
+            _read_engine = get_engine()
+        else:
+            _read_engine = create_engine(
+                db_url,
+                poolclass=QueuePool,
+                pool_size=5,
+                max_overflow=10,
+                pool_recycle=3600,
+                connect_args=_SQLITE_CONNECT_ARGS,
+            )
+            event.listen(_read_engine, "connect", _set_sqlite_pragmas)
+            event.listen(_read_engine, "connect", _set_query_only)
+    return _read_engine
+
+
 def create_schema(engine) -> None:
     """Create database tables if they don't exist."""
-    with engine.connect() as conn:
+    with engine.begin() as conn:
         conn.execute(text("""
             CREATE TABLE IF NOT EXISTS customers (
                 id TEXT PRIMARY KEY,
@@ -38,135 +133,146 @@ def create_schema(engine) -> None:
                 shipping_cost REAL NOT NULL DEFAULT 0.0
             )
         """))
-        conn.commit()
-
-
-def seed_sample_data(engine) -> None:
-    """Seed database with sample data if tables are empty."""
-    with engine.connect() as conn:
-        count = conn.execute(text("SELECT COUNT(*) FROM customers")).scalar()
-        if count > 0:
-            return
-
-        conn.execute(
-            text(
-                "INSERT INTO customers (id, name, tier, email) "
-                "VALUES (:id, :name, :tier, :email)"
-            ),
-            [
-                {
-                    "id": "CUST-001",
-                    "name": "John Doe",
-                    "tier": "standard",
-                    "email": "john@example.com",
-                },
-                {
-                    "id": "CUST-002",
-                    "name": "Jane Smith",
-                    "tier": "gold",
-                    "email": "jane@example.com",
-                },
-                {
-                    "id": "CUST-003",
-                    "name": "Bob Johnson",
-                    "tier": "platinum",
-                    "email": "bob@example.com",
-                },
-                {
-                    "id": "CUST-004",
-                    "name": "Alice Williams",
-                    "tier": "standard",
-                    "email": "alice@example.com",
-                },
-                {
-                    "id": "CUST-005",
-                    "name": "Charlie Brown",
-                    "tier": "gold",
-                    "email": "charlie@example.com",
-                },
-            ],
-        )
-
-        conn.execute(
-            text(
-                "INSERT INTO orders (id, customer_id, price, status, "
-                "delivered_date_days_ago, shipping_speed, shipping_cost) "
-                "VALUES (:id, :customer_id, :price, :status, "
-                ":delivered_date_days_ago, :shipping_speed, :shipping_cost)"
-            ),
-            [
-                {  # CUST-001 (standard), $75 >= $50 → free standard
-                    "id": "ORD-001",
-                    "customer_id": "CUST-001",
-                    "price": 75.00,
-                    "status": "delivered",
-                    "delivered_date_days_ago": 5,
-                    "shipping_speed": "standard",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-002 (gold), $250 → free expedited (gold perk)
-                    "id": "ORD-002",
-                    "customer_id": "CUST-002",
-                    "price": 250.00,
-                    "status": "delivered",
-                    "delivered_date_days_ago": 35,
-                    "shipping_speed": "expedited",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-003 (platinum), $1500 → free express (platinum perk)
-                    "id": "ORD-003",
-                    "customer_id": "CUST-003",
-                    "price": 1500.00,
-                    "status": "delivered",
-                    "delivered_date_days_ago": 10,
-                    "shipping_speed": "express",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-001 (standard), $49.99 < $50 → pays $12.99 expedited
-                    "id": "ORD-004",
-                    "customer_id": "CUST-001",
-                    "price": 49.99,
-                    "status": "shipped",
-                    "delivered_date_days_ago": 0,
-                    "shipping_speed": "expedited",
-                    "shipping_cost": 12.99,
-                },
-                {  # CUST-004 (standard), $120 >= $50 → free standard
-                    "id": "ORD-005",
-                    "customer_id": "CUST-004",
-                    "price": 120.00,
-                    "status": "processing",
-                    "delivered_date_days_ago": 0,
-                    "shipping_speed": "standard",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-002 (gold), $199.99 → free standard (gold perk)
-                    "id": "ORD-006",
-                    "customer_id": "CUST-002",
-                    "price": 199.99,
-                    "status": "delivered",
-                    "delivered_date_days_ago": 3,
-                    "shipping_speed": "standard",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-005 (gold), $55 → free expedited (gold perk)
-                    "id": "ORD-007",
-                    "customer_id": "CUST-005",
-                    "price": 55.00,
-                    "status": "delivered",
-                    "delivered_date_days_ago": 2,
-                    "shipping_speed": "expedited",
-                    "shipping_cost": 0.00,
-                },
-                {  # CUST-003 (platinum), $89.99 → free express (platinum perk)
-                    "id": "ORD-008",
-                    "customer_id": "CUST-003",
-                    "price": 89.99,
-                    "status": "pending",
-                    "delivered_date_days_ago": 0,
-                    "shipping_speed": "express",
-                    "shipping_cost": 0.00,
-                },
-            ],
-        )
-        conn.commit()
+        # Covering index: per-customer order queries are answered from the
+        # index alone
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_orders_customer_covering ON orders (
+                customer_id, id, price, status, delivered_date_days_ago,
+                shipping_speed, shipping_cost
+            )
+        """))
+
+
+def seed_sample_data(conn) -> None:
+    """
+    Seed database with sample data if tables are empty.
+
+    All rows are bulk-inserted through the given connection; the caller owns
+    the transaction (e.g. ``with engine.begin() as conn``), so seeding is a
+    single commit.
+    """
+    has_data = conn.execute(text("SELECT 1 FROM customers LIMIT 1")).scalar()
+    if has_data is not None:
+        return
+
+    conn.execute(
+        text(
+            "INSERT INTO customers (id, name, tier, email) "
+            "VALUES (:id, :name, :tier, :email)"
+        ),
+        [
+            {
+                "id": "CUST-001",
+                "name": "John Doe",
+                "tier": "standard",
+                "email": "john@example.com",
+            },
+            {
+                "id": "CUST-002",
+                "name": "Jane Smith",
+                "tier": "gold",
+                "email": "jane@example.com",
+            },
+            {
+                "id": "CUST-003",
+                "name": "Bob Johnson",
+                "tier": "platinum",
+                "email": "bob@example.com",
+            },
+            {
+                "id": "CUST-004",
+                "name": "Alice Williams",
+                "tier": "standard",
+                "email": "alice@example.com",
+            },
+            {
+                "id": "CUST-005",
+                "name": "Charlie Brown",
+                "tier": "gold",
+                "email": "charlie@example.com",
+            },
+        ],
+    )
+
+    conn.execute(
+        text(
+            "INSERT INTO orders (id, customer_id, price, status, "
+            "delivered_date_days_ago, shipping_speed, shipping_cost) "
+            "VALUES (:id, :customer_id, :price, :status, "
+            ":delivered_date_days_ago, :shipping_speed, :shipping_cost)"
+        ),
+        [
+            {  # CUST-001 (standard), $75 >= $50 → free standard
+                "id": "ORD-001",
+                "customer_id": "CUST-001",
+                "price": 75.00,
+                "status": "delivered",
+                "delivered_date_days_ago": 5,
+                "shipping_speed": "standard",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-002 (gold), $250 → free expedited (gold perk)
+                "id": "ORD-002",
+                "customer_id": "CUST-002",
+                "price": 250.00,
+                "status": "delivered",
+                "delivered_date_days_ago": 35,
+                "shipping_speed": "expedited",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-003 (platinum), $1500 → free express (platinum perk)
+                "id": "ORD-003",
+                "customer_id": "CUST-003",
+                "price": 1500.00,
+                "status": "delivered",
+                "delivered_date_days_ago": 10,
+                "shipping_speed": "express",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-001 (standard), $49.99 < $50 → pays $12.99 expedited
+                "id": "ORD-004",
+                "customer_id": "CUST-001",
+                "price": 49.99,
+                "status": "shipped",
+                "delivered_date_days_ago": 0,
+                "shipping_speed": "expedited",
+                "shipping_cost": 12.99,
+            },
+            {  # CUST-004 (standard), $120 >= $50 → free standard
+                "id": "ORD-005",
+                "customer_id": "CUST-004",
+                "price": 120.00,
+                "status": "processing",
+                "delivered_date_days_ago": 0,
+                "shipping_speed": "standard",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-002 (gold), $199.99 → free standard (gold perk)
+                "id": "ORD-006",
+                "customer_id": "CUST-002",
+                "price": 199.99,
+                "status": "delivered",
+                "delivered_date_days_ago": 3,
+                "shipping_speed": "standard",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-005 (gold), $55 → free expedited (gold perk)
+                "id": "ORD-007",
+                "customer_id": "CUST-005",
+                "price": 55.00,
+                "status": "delivered",
+                "delivered_date_days_ago": 2,
+                "shipping_speed": "expedited",
+                "shipping_cost": 0.00,
+            },
+            {  # CUST-003 (platinum), $89.99 → free express (platinum perk)
+                "id": "ORD-008",
+                "customer_id": "CUST-003",
+                "price": 89.99,
+                "status": "pending",
+                "delivered_date_days_ago": 0,
+                "shipping_speed": "express",
+                "shipping_cost": 0.00,
+            },
+        ],
+    )
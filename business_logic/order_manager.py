@@ -33,6 +33,12 @@ EXPRESS_SHIPPING_COST = 24.99
 # Free shipping threshold
 FREE_SHIPPING_THRESHOLD = 50.00
 
+_PRICE_BY_SPEED = {
+    ShippingSpeed.STANDARD: STANDARD_SHIPPING_COST,
+    ShippingSpeed.EXPEDITED: EXPEDITED_SHIPPING_COST,
+    ShippingSpeed.EXPRESS: EXPRESS_SHIPPING_COST,
+}
+
 
 class OrderManager:
     """
@@ -80,22 +86,16 @@ class OrderManager:
             return 0.00
 
         # Premium member benefits
-        if customer_tier.lower() == "platinum":
+        tier = customer_tier.lower()
+        if tier == "platinum":
             # Platinum gets free express shipping
             return 0.00
-        elif (
-            customer_tier.lower() == "gold" and shipping_speed != ShippingSpeed.EXPRESS
-        ):
+        if tier == "gold" and shipping_speed != ShippingSpeed.EXPRESS:
             # Gold gets free standard and expedited shipping
             return 0.00
 
         # Standard pricing
-        if shipping_speed == ShippingSpeed.EXPRESS:
-            return EXPRESS_SHIPPING_COST
-        elif shipping_speed == ShippingSpeed.EXPEDITED:
-            return EXPEDITED_SHIPPING_COST
-        else:
-            return STANDARD_SHIPPING_COST
+        return _PRICE_BY_SPEED[shipping_speed]
 
     def can_cancel_order(self, order_status: OrderStatus) -> bool:
         """
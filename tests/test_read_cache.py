@@ -0,0 +1,92 @@
+"""Tests for the read tool cache in tools.py."""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# In-memory test database without sample data; seeded per test below
+os.environ.setdefault("AGENT_TEST_MODE", "true")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tools  # noqa: E402
+from backend_service import seed_sample_data  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+class ReadCacheTest(unittest.TestCase):
+    """_cached_read results are reused until a write clears them."""
+
+    def setUp(self):
+        with tools.db_engine.begin() as conn:
+            seed_sample_data(conn)
+
+        # The cache is bypassed in test mode; exercise it explicitly here
+        patcher = mock.patch.object(tools, "_read_cache_enabled", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tools.clear_read_cache()
+        self.addCleanup(tools.clear_read_cache)
+
+    def _set_order_status(self, order_id, status):
+        with tools.db_engine.begin() as conn:
+            conn.execute(
+                text("UPDATE orders SET status = :status WHERE id = :order_id"),
+                {"status": status, "order_id": order_id},
+            )
+
+    def test_repeated_read_is_served_from_cache(self):
+        calls = []
+
+        @tools._cached_read
+        def read(item_id):
+            calls.append(item_id)
+            return f"value for {item_id}"
+
+        self.assertEqual(read("A"), "value for A")
+        self.assertEqual(read("A"), "value for A")
+        self.assertEqual(calls, ["A"])
+
+    def test_read_overlapping_a_clear_is_not_cached(self):
+        results = iter(["stale", "fresh"])
+
+        @tools._cached_read
+        def read(item_id):
+            # A write commits and clears the cache while this read runs
+            result = next(results)
+            if result == "stale":
+                tools.clear_read_cache()
+            return result
+
+        self.assertEqual(read("A"), "stale")
+        self.assertEqual(read("A"), "fresh")
+
+    def test_cancel_order_invalidates_cached_lookup(self):
+        self._set_order_status("ORD-008", "pending")
+        self.addCleanup(self._set_order_status, "ORD-008", "pending")
+        tools.clear_read_cache()
+
+        before = tools.lookup_order.invoke({"order_id": "ORD-008"})
+        self.assertIn("Status: pending", before)
+
+        tools.cancel_order.invoke({"order_id": "ORD-008"})
+
+        after = tools.lookup_order.invoke({"order_id": "ORD-008"})
+        self.assertIn("Status: cancelled", after)
+
+    def test_cache_is_bypassed_when_disabled(self):
+        calls = []
+
+        @tools._cached_read
+        def read(item_id):
+            calls.append(item_id)
+            return item_id
+
+        with mock.patch.object(tools, "_read_cache_enabled", False):
+            read("A")
+            read("A")
+        self.assertEqual(calls, ["A", "A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
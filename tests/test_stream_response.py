@@ -0,0 +1,136 @@
+"""Tests for agent._stream_response, which starts tool calls while streaming."""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault("AGENT_TEST_MODE", "true")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agent  # noqa: E402
+from langchain_core.messages import AIMessageChunk  # noqa: E402
+
+
+class FakeStreamingLLM:
+    """Streams the given tool calls with each call's args split over two chunks."""
+
+    def __init__(self, tool_calls, events, fail_after=None):
+        self.tool_calls = tool_calls
+        self.events = events
+        self.fail_after = fail_after
+
+    async def astream(self, messages):
+        for index, tool_call in enumerate(self.tool_calls):
+            args = json.dumps(tool_call["args"])
+            for part, chunk_args in enumerate((args[:3], args[3:])):
+                first = part == 0
+                yield AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": tool_call["name"] if first else None,
+                            "args": chunk_args,
+                            "id": tool_call["id"] if first else None,
+                            "index": index,
+                        }
+                    ],
+                )
+                self.events.append(f"chunk {tool_call['id']}.{part}")
+                # Give dispatched tool tasks a chance to start
+                await asyncio.sleep(0)
+                if self.fail_after == (tool_call["id"], part):
+                    raise RuntimeError("stream dropped")
+        self.events.append("stream end")
+
+
+class StreamResponseTest(unittest.IsolatedAsyncioTestCase):
+    """Tool calls start as soon as they are fully decoded."""
+
+    async def asyncSetUp(self):
+        self.events = []
+        self.executed = []
+        self.cancelled = []
+        self.delays = {}
+        self.block = asyncio.Event()
+
+        async def fake_execute_tool(tool_call, tool_map):
+            self.executed.append((tool_call["id"], tool_call["args"]))
+            self.events.append(f"start {tool_call['id']}")
+            try:
+                if tool_call["id"] in self.delays:
+                    await asyncio.sleep(self.delays[tool_call["id"]])
+                else:
+                    await self.block.wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(tool_call["id"])
+                raise
+            return f"result {tool_call['id']}"
+
+        patcher = mock.patch.object(agent, "_execute_tool", fake_execute_tool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _llm(self, count, fail_after=None):
+        tool_calls = [
+            {"name": "lookup_order", "args": {"order_id": f"ORD-00{i}"}, "id": f"c{i}"}
+            for i in range(count)
+        ]
+        return FakeStreamingLLM(tool_calls, self.events, fail_after=fail_after)
+
+    async def test_args_split_across_chunks_are_reassembled(self):
+        self.block.set()
+        response, tasks = await agent._stream_response(self._llm(2), [], {})
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(
+            self.executed,
+            [("c0", {"order_id": "ORD-000"}), ("c1", {"order_id": "ORD-001"})],
+        )
+        self.assertEqual([tc["id"] for tc in response.tool_calls], ["c0", "c1"])
+
+    async def test_call_starts_before_stream_ends(self):
+        self.block.set()
+        _, tasks = await agent._stream_response(self._llm(3), [], {})
+        await asyncio.gather(*tasks)
+
+        # Each call starts once the next call's first chunk arrives; the last
+        # one starts after the stream ends
+        end = self.events.index("stream end")
+        self.assertLess(self.events.index("start c0"), end)
+        self.assertLess(self.events.index("chunk c1.0"), self.events.index("start c0"))
+        self.assertLess(self.events.index("start c1"), end)
+        self.assertGreater(self.events.index("start c2"), end)
+        self.assertEqual([call_id for call_id, _ in self.executed], ["c0", "c1", "c2"])
+
+    async def test_results_follow_tool_call_order(self):
+        # Earlier calls finish last
+        self.delays = {"c0": 0.03, "c1": 0.02, "c2": 0.0}
+        response, tasks = await agent._stream_response(self._llm(3), [], {})
+
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(len(tasks), len(response.tool_calls))
+        self.assertEqual(results, ["result c0", "result c1", "result c2"])
+
+    async def test_started_calls_are_cancelled_when_stream_fails(self):
+        llm = self._llm(3, fail_after=("c1", 1))
+
+        with self.assertRaises(RuntimeError):
+            await agent._stream_response(llm, [], {})
+        await asyncio.sleep(0)
+
+        self.assertEqual([call_id for call_id, _ in self.executed], ["c0"])
+        self.assertEqual(self.cancelled, ["c0"])
+
+    async def test_empty_stream_returns_empty_message(self):
+        response, tasks = await agent._stream_response(self._llm(0), [], {})
+
+        self.assertEqual(response.content, "")
+        self.assertEqual(tasks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
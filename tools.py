@@ -2,36 +2,194 @@
 LangChain tools for the customer service agent.
 
 Exposes business logic and SQLite database as callable tools for the LLM.
-Database URL is determined at import time from environment variables:
+The database is set up on first use (first tool call or first access to
+``tools.db_engine``), with the URL taken from environment variables:
 - Normal mode: sqlite:///techgear.db
-- Test mode (AGENT_TEST_MODE=true): uses TEST_DB_URL env var
+- Test mode (AGENT_TEST_MODE=true): a separate test database, in-memory
+  (sqlite://) unless TEST_DB_URL points elsewhere
 """
 
+import functools
+import itertools
+import operator
 import os
-from langchain.tools import tool
-from sqlalchemy import create_engine, text
+import threading
+from contextlib import contextmanager
 
-from backend_service import get_db_url, create_schema, seed_sample_data
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from langchain.tools import tool
+from sqlalchemy import text
+
+from backend_service import (
+    get_engine,
+    get_read_engine,
+    create_schema,
+    seed_sample_data,
+)
 from business_logic.refund_processor import RefundProcessor, CustomerTier, RefundStatus
 from business_logic.order_manager import OrderManager, OrderStatus, ShippingSpeed
 
-# Initialize SQLite database connection
-_db_url = get_db_url()
-db_engine = create_engine(_db_url, connect_args={"check_same_thread": False})
-create_schema(db_engine)
-
-# Only seed sample data in non-test mode
-if os.getenv("AGENT_TEST_MODE") != "true":
-    seed_sample_data(db_engine)
+# SQLite read-write engine, created with its schema (and sample data) by
+# _ensure_db(), and the read-only engine the read tools query
+_db_engine = None
+_db_read_engine = None
+_db_lock = threading.Lock()
 
 refund_processor = RefundProcessor()
 order_manager = OrderManager()
 
+# Tool string arguments -> business logic enums (keyed by the enum values)
+_TIER_MAP = {tier.value: tier for tier in CustomerTier}
+_SPEED_MAP = {speed.value: speed for speed in ShippingSpeed}
+_STATUS_MAP = {status.value: status for status in OrderStatus}
+_REFUND_STATUS_TEXT = {
+    RefundStatus.APPROVED: "APPROVED",
+    RefundStatus.DENIED: "DENIED",
+    RefundStatus.PENDING_REVIEW: "PENDING_REVIEW",
+}
+
+# Business rule answers that depend only on an enum, computed once at import
+_REFUND_WINDOW_DAYS = {
+    tier: refund_processor.get_refund_window_for_tier(tier) for tier in CustomerTier
+}
+_DELIVERY_ESTIMATE = {
+    speed: order_manager.get_delivery_estimate(speed) for speed in ShippingSpeed
+}
+_CAN_CANCEL = {status: order_manager.can_cancel_order(status) for status in OrderStatus}
+_CAN_MODIFY = {status: order_manager.can_modify_order(status) for status in OrderStatus}
+
+# SQL for the hot read tools, which run directly on the sqlite3 connection
+_ORDER_WITH_CUSTOMER_SQL = (
+    "SELECT o.id, o.customer_id, o.price, o.status, "
+    "o.delivered_date_days_ago, o.shipping_speed, o.shipping_cost, "
+    "c.name, c.tier "
+    "FROM orders o JOIN customers c ON c.id = o.customer_id "
+    "WHERE o.id = ?"
+)
+_CUSTOMER_ORDERS_SQL = (
+    "SELECT id, price, status, delivered_date_days_ago, "
+    "shipping_speed, shipping_cost "
+    "FROM orders WHERE customer_id = ?"
+)
+_CUSTOMERS_ORDERS_SQL = (
+    "SELECT customer_id, id, price, status, delivered_date_days_ago, "
+    "shipping_speed, shipping_cost "
+    "FROM orders WHERE customer_id IN ({placeholders}) ORDER BY customer_id"
+)
+_CUSTOMER_SQL = "SELECT id, name, tier, email FROM customers WHERE id = ?"
+_CUSTOMER_CONTEXT_SQL = (
+    "SELECT c.id, c.name, c.tier, c.email, "
+    "o.id, o.price, o.status, o.delivered_date_days_ago, "
+    "o.shipping_speed, o.shipping_cost "
+    "FROM customers c LEFT JOIN orders o ON o.customer_id = c.id "
+    "WHERE c.id = ?"
+)
+
+# Column positions used to slice the multi-part rows of the queries above
+_CTX_ORDER_START = 4  # first orders column of a _CUSTOMER_CONTEXT_SQL row
+_CTX_ORDER_ID = _CTX_ORDER_START  # NULL when the customer has no orders
+_ORDERS_CUSTOMER_ID = 0  # leading customer_id of a _CUSTOMERS_ORDERS_SQL row
+_ORDERS_ORDER_START = 1  # the order columns that follow it
+
+
+@contextmanager
+def _raw_connection():
+    """
+    Check out a pooled read-only sqlite3 connection.
+
+    Read tools use it to skip SQLAlchemy Core's statement compilation and Row
+    wrapping; the connection goes back to the pool on exit.
+    """
+    _ensure_db()
+    conn = _db_read_engine.raw_connection()
+    try:
+        yield conn.driver_connection
+    finally:
+        conn.close()
+
+
+# Short-lived cache for the read-only DB tools, keyed by (tool name, ID).
+# Writers call clear_read_cache() once their commit has returned. It is
+# bypassed entirely in test mode, where fixtures rewrite the data between cases.
+_read_cache = TTLCache(maxsize=1024, ttl=30)
+_read_cache_lock = threading.Lock()
+_read_cache_enabled = os.getenv("AGENT_TEST_MODE") != "true"
+# Bumped by every clear, so a read that overlapped a write isn't cached
+_read_cache_generation = 0
+
+
+def clear_read_cache() -> None:
+    """
+    Drop all cached read tool results.
+
+    Call it after committing any write to the database (cancel_order does);
+    reads still in flight from before the call will not be cached.
+    """
+    global _read_cache_generation
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        _read_cache.clear()
+
+
+def _ensure_db():
+    """
+    Return the read-write SQLite engine, creating the schema on first use.
+
+    Sample data is only seeded in non-test mode. Deferring this keeps
+    ``import tools`` free of database I/O.
+    """
+    global _db_engine, _db_read_engine
+    if _db_engine is None:
+        with _db_lock:
+            if _db_engine is None:
+                engine = get_engine()
+                create_schema(engine)
+                if os.getenv("AGENT_TEST_MODE") != "true":
+                    with engine.begin() as conn:
+                        seed_sample_data(conn)
+                _db_read_engine = get_read_engine()
+                _db_engine = engine
+    return _db_engine
+
+
+def __getattr__(name: str):
+    """Expose ``db_engine`` lazily so external callers also get a ready database."""
+    if name == "db_engine":
+        return _ensure_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _cached_read(func):
+    """Cache a single-ID read tool body in _read_cache, except in test mode."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _read_cache_enabled:
+            return func(*args, **kwargs)
+
+        key = hashkey(func.__name__, *args, **kwargs)
+        with _read_cache_lock:
+            result = _read_cache.get(key)
+            generation = _read_cache_generation
+        if result is not None:
+            return result
+
+        result = func(*args, **kwargs)
+        with _read_cache_lock:
+            # Only store results that no clear_read_cache() call has overtaken
+            if generation == _read_cache_generation:
+                _read_cache[key] = result
+        return result
+
+    return wrapper
+
 
 @tool
+@_cached_read
 def lookup_order(order_id: str) -> str:
     """
-    Look up order details by order ID.
+    Look up order details, including the customer's tier, by order ID.
 
     Args:
         order_id: The order ID to look up (e.g., "ORD-001")
@@ -39,95 +197,166 @@ def lookup_order(order_id: str) -> str:
     Returns:
         Order details as a formatted string, or error message if not found
     """
-    with db_engine.connect() as conn:
-        row = conn.execute(
-            text(
-                "SELECT o.id, o.customer_id, c.name, o.price, o.status, "
-                "o.delivered_date_days_ago, o.shipping_speed, o.shipping_cost "
-                "FROM orders o JOIN customers c ON o.customer_id = c.id "
-                "WHERE o.id = :order_id"
-            ),
-            {"order_id": order_id},
-        ).fetchone()
+    with _raw_connection() as conn:
+        row = conn.execute(_ORDER_WITH_CUSTOMER_SQL, (order_id,)).fetchone()
 
     if not row:
         return f"Order {order_id} not found in system."
 
-    shipping_label = f"${row[7]:.2f}" if row[7] > 0 else "Free"
+    oid, customer_id, price, status, days, speed, cost, name, tier = row
+    shipping_label = f"${cost:.2f}" if cost > 0 else "Free"
     return (
         f"Order Details:\n"
-        f"ID: {row[0]}\n"
-        f"Customer: {row[2]} ({row[1]})\n"
-        f"Amount: ${row[3]:.2f}\n"
-        f"Status: {row[4]}\n"
-        f"Days since delivery: {row[5]}\n"
-        f"Shipping speed: {row[6]}\n"
+        f"ID: {oid}\n"
+        f"Customer: {name} ({customer_id})\n"
+        f"Customer tier: {tier.upper()}\n"
+        f"Amount: ${price:.2f}\n"
+        f"Status: {status}\n"
+        f"Days since delivery: {days}\n"
+        f"Shipping speed: {speed}\n"
         f"Shipping cost: {shipping_label}"
     )
 
 
+def _format_order_line(order: tuple) -> str:
+    """Format an (id, price, status, days, speed, cost) order row as a list item."""
+    order_id, price, status, days, speed, cost = order
+    shipping_label = f"${cost:.2f}" if cost > 0 else "Free"
+    return (
+        f"- {order_id}: ${price:.2f}, Status: {status}, "
+        f"Delivered {days} days ago, "
+        f"Shipping: {speed} ({shipping_label})"
+    )
+
+
+def _format_customer_orders(customer_id: str, rows: list) -> str:
+    """Format a customer's order rows as the get_customer_orders tool output."""
+    if not rows:
+        return f"No orders found for customer {customer_id}."
+
+    lines = [_format_order_line(row) for row in rows]
+    return f"Orders for customer {customer_id}:\n" + "\n".join(lines)
+
+
+@tool
+@_cached_read
+def get_customer_context(customer_id: str) -> str:
+    """
+    Get a customer's details and all of their orders in one call.
+
+    Prefer this over calling lookup_customer and get_customer_orders separately.
+
+    Args:
+        customer_id: The customer ID (e.g., "CUST-001")
+
+    Returns:
+        Customer details and order list as a formatted string, or error message
+        if the customer is not found
+    """
+    with _raw_connection() as conn:
+        rows = conn.execute(_CUSTOMER_CONTEXT_SQL, (customer_id,)).fetchall()
+
+    if not rows:
+        return f"Customer {customer_id} not found in system."
+
+    cid, name, tier, email = rows[0][:_CTX_ORDER_START]
+    order_lines = [
+        _format_order_line(row[_CTX_ORDER_START:])
+        for row in rows
+        if row[_CTX_ORDER_ID] is not None
+    ]
+    return (
+        f"Customer Details:\n"
+        f"ID: {cid}\n"
+        f"Name: {name}\n"
+        f"Tier: {tier.upper()}\n"
+        f"Email: {email}\n"
+        f"Orders:\n" + ("\n".join(order_lines) if order_lines else "No orders found.")
+    )
+
+
 @tool
+@_cached_read
 def get_customer_orders(customer_id: str) -> str:
     """
     Get all orders for a customer.
 
+    Use get_customer_context instead if you also need the customer's details.
+
     Args:
         customer_id: The customer ID (e.g., "CUST-001")
 
     Returns:
         List of customer's orders as a formatted string
     """
-    with db_engine.connect() as conn:
-        rows = conn.execute(
-            text(
-                "SELECT id, price, status, delivered_date_days_ago, "
-                "shipping_speed, shipping_cost "
-                "FROM orders WHERE customer_id = :customer_id"
-            ),
-            {"customer_id": customer_id},
-        ).fetchall()
+    with _raw_connection() as conn:
+        rows = conn.execute(_CUSTOMER_ORDERS_SQL, (customer_id,)).fetchall()
 
-    if not rows:
-        return f"No orders found for customer {customer_id}."
+    return _format_customer_orders(customer_id, rows)
 
-    orders_text = f"Orders for customer {customer_id}:\n"
-    for row in rows:
-        shipping_label = f"${row[5]:.2f}" if row[5] > 0 else "Free"
-        orders_text += (
-            f"- {row[0]}: ${row[1]:.2f}, Status: {row[2]}, "
-            f"Delivered {row[3]} days ago, "
-            f"Shipping: {row[4]} ({shipping_label})\n"
-        )
 
-    return orders_text.rstrip()
+def get_customers_orders(customer_ids: list[str]) -> dict[str, str]:
+    """
+    Get the orders for several customers with a single query.
+
+    Intended for batch/evaluation code; the agent itself uses the
+    get_customer_orders tool.
+
+    Args:
+        customer_ids: Customer IDs to look up (e.g., ["CUST-001", "CUST-002"])
+
+    Returns:
+        Mapping of each customer ID to the text get_customer_orders returns for it
+    """
+    customer_ids = list(dict.fromkeys(customer_ids))
+    if not customer_ids:
+        return {}
+
+    sql = _CUSTOMERS_ORDERS_SQL.format(placeholders=", ".join("?" * len(customer_ids)))
+    with _raw_connection() as conn:
+        rows = conn.execute(sql, customer_ids).fetchall()
+
+    rows_by_customer = {
+        customer_id: [row[_ORDERS_ORDER_START:] for row in group]
+        for customer_id, group in itertools.groupby(
+            rows, key=operator.itemgetter(_ORDERS_CUSTOMER_ID)
+        )
+    }
+    return {
+        customer_id: _format_customer_orders(
+            customer_id, rows_by_customer.get(customer_id, [])
+        )
+        for customer_id in customer_ids
+    }
 
 
 @tool
+@_cached_read
 def lookup_customer(customer_id: str) -> str:
     """
     Look up customer details by customer ID.
 
+    Use get_customer_context instead if you also need the customer's orders.
+
     Args:
         customer_id: The customer ID to look up (e.g., "CUST-001")
 
     Returns:
         Customer details as a formatted string, or error message if not found
     """
-    with db_engine.connect() as conn:
-        row = conn.execute(
-            text("SELECT id, name, tier, email FROM customers WHERE id = :customer_id"),
-            {"customer_id": customer_id},
-        ).fetchone()
+    with _raw_connection() as conn:
+        row = conn.execute(_CUSTOMER_SQL, (customer_id,)).fetchone()
 
     if not row:
         return f"Customer {customer_id} not found in system."
 
+    cid, name, tier, email = row
     return (
         f"Customer Details:\n"
-        f"ID: {row[0]}\n"
-        f"Name: {row[1]}\n"
-        f"Tier: {row[2].upper()}\n"
-        f"Email: {row[3]}"
+        f"ID: {cid}\n"
+        f"Name: {name}\n"
+        f"Tier: {tier.upper()}\n"
+        f"Email: {email}"
     )
 
 
@@ -152,13 +381,9 @@ def process_refund_request(
     Returns:
         Refund decision (APPROVED, DENIED, or PENDING_REVIEW) as a formatted string
     """
-    try:
-        tier_enum = {
-            "standard": CustomerTier.STANDARD,
-            "gold": CustomerTier.GOLD,
-            "platinum": CustomerTier.PLATINUM,
-        }.get(customer_tier.lower(), CustomerTier.STANDARD)
+    tier_enum = _TIER_MAP.get(customer_tier.lower(), CustomerTier.STANDARD)
 
+    try:
         status = refund_processor.process_refund_request(
             order_id=order_id,
             customer_tier=tier_enum,
@@ -166,30 +391,25 @@ def process_refund_request(
             days_since_delivery=days_since_delivery,
             is_damaged=is_damaged,
         )
+    except ValueError as e:
+        return f"Error processing refund: {str(e)}"
 
-        status_text = {
-            RefundStatus.APPROVED: "APPROVED",
-            RefundStatus.DENIED: "DENIED",
-            RefundStatus.PENDING_REVIEW: "PENDING_REVIEW",
-        }.get(status, "UNKNOWN")
-
-        result = (
-            f"Refund Request Result:\n"
-            f"  Status: {status_text}\n"
-            f"  Order: {order_id}\n"
-            f"  Amount: ${order_total:.2f}"
-        )
+    status_text = _REFUND_STATUS_TEXT.get(status, "UNKNOWN")
 
-        if status == RefundStatus.PENDING_REVIEW:
-            if order_total > 1000:
-                result += "\n  Approval level: executive"
-            else:
-                result += "\n  Approval level: manager"
+    result = (
+        f"Refund Request Result:\n"
+        f"  Status: {status_text}\n"
+        f"  Order: {order_id}\n"
+        f"  Amount: ${order_total:.2f}"
+    )
 
-        return result
+    if status == RefundStatus.PENDING_REVIEW:
+        if order_total > 1000:
+            result += "\n  Approval level: executive"
+        else:
+            result += "\n  Approval level: manager"
 
-    except Exception as e:
-        return f"Error processing refund: {str(e)}"
+    return result
 
 
 @tool
@@ -203,16 +423,34 @@ def get_refund_window(customer_tier: str) -> str:
     Returns:
         Number of days in the refund window
     """
-    tier_enum = {
-        "standard": CustomerTier.STANDARD,
-        "gold": CustomerTier.GOLD,
-        "platinum": CustomerTier.PLATINUM,
-    }.get(customer_tier.lower(), CustomerTier.STANDARD)
-
-    days = refund_processor.get_refund_window_for_tier(tier_enum)
+    tier_enum = _TIER_MAP.get(customer_tier.lower(), CustomerTier.STANDARD)
+    days = _REFUND_WINDOW_DAYS[tier_enum]
     return f"{customer_tier.upper()} tier customers have a {days}-day refund window."
 
 
+# Shipping quotes depend on the order total, so they are cached per call
+# arguments rather than precomputed like the enum-only answers.
+@functools.lru_cache(maxsize=256)
+def _calculate_shipping_cost(
+    order_total: float, shipping_speed: str, customer_tier: str = "standard"
+) -> str:
+    """Format the shipping cost quote for an order total, speed and tier."""
+    speed_enum = _SPEED_MAP.get(shipping_speed.lower(), ShippingSpeed.STANDARD)
+
+    try:
+        cost = order_manager.get_shipping_cost(
+            order_total=order_total,
+            shipping_speed=speed_enum,
+            customer_tier=customer_tier.lower(),
+        )
+    except ValueError as e:
+        return f"Error calculating shipping: {str(e)}"
+
+    if cost == 0:
+        return f"Shipping cost: $0.00 (free {shipping_speed.lower()} shipping — order total ${order_total:.2f} qualifies for free shipping)."
+    return f"{shipping_speed.lower().capitalize()} shipping cost: ${cost:.2f} for order total ${order_total:.2f}."
+
+
 @tool
 def calculate_shipping_cost(
     order_total: float, shipping_speed: str, customer_tier: str = "standard"
@@ -228,25 +466,7 @@ def calculate_shipping_cost(
     Returns:
         Shipping cost as a formatted string
     """
-    try:
-        speed_enum = {
-            "standard": ShippingSpeed.STANDARD,
-            "expedited": ShippingSpeed.EXPEDITED,
-            "express": ShippingSpeed.EXPRESS,
-        }.get(shipping_speed.lower(), ShippingSpeed.STANDARD)
-
-        cost = order_manager.get_shipping_cost(
-            order_total=order_total,
-            shipping_speed=speed_enum,
-            customer_tier=customer_tier.lower(),
-        )
-
-        if cost == 0:
-            return f"Shipping cost: $0.00 (free {shipping_speed.lower()} shipping — order total ${order_total:.2f} qualifies for free shipping)."
-        return f"{shipping_speed.lower().capitalize()} shipping cost: ${cost:.2f} for order total ${order_total:.2f}."
-
-    except Exception as e:
-        return f"Error calculating shipping: {str(e)}"
+    return _calculate_shipping_cost(order_total, shipping_speed, customer_tier)
 
 
 @tool
@@ -260,7 +480,7 @@ def cancel_order(order_id: str) -> str:
     Returns:
         Cancellation result as a formatted string
     """
-    with db_engine.connect() as conn:
+    with _ensure_db().connect() as conn:
         row = conn.execute(
             text("SELECT id, status FROM orders WHERE id = :order_id"),
             {"order_id": order_id},
@@ -269,7 +489,7 @@ def cancel_order(order_id: str) -> str:
         if not row:
             return f"Order {order_id} not found in system."
 
-        status = row[1]
+        _, status = row
         cancellable_statuses = {"pending", "processing"}
         if status not in cancellable_statuses:
             return (
@@ -283,6 +503,7 @@ def cancel_order(order_id: str) -> str:
             {"order_id": order_id},
         )
         conn.commit()
+    clear_read_cache()
 
     return f"Order {order_id} has been successfully cancelled."
 
@@ -298,20 +519,8 @@ def check_can_cancel_order(order_status: str) -> str:
     Returns:
         Whether the order can be cancelled (yes/no) as a formatted string
     """
-    try:
-        status_enum = {
-            "pending": OrderStatus.PENDING,
-            "processing": OrderStatus.PROCESSING,
-            "shipped": OrderStatus.SHIPPED,
-            "delivered": OrderStatus.DELIVERED,
-            "cancelled": OrderStatus.CANCELLED,
-        }.get(order_status.lower(), OrderStatus.SHIPPED)
-
-        can_cancel = order_manager.can_cancel_order(status_enum)
-        return f"Order can be cancelled: {can_cancel}"
-
-    except Exception as e:
-        return f"Error checking cancellation: {str(e)}"
+    status_enum = _STATUS_MAP.get(order_status.lower(), OrderStatus.SHIPPED)
+    return f"Order can be cancelled: {_CAN_CANCEL[status_enum]}"
 
 
 @tool
@@ -325,20 +534,8 @@ def check_can_modify_order(order_status: str) -> str:
     Returns:
         Whether the order can be modified (yes/no) as a formatted string
     """
-    try:
-        status_enum = {
-            "pending": OrderStatus.PENDING,
-            "processing": OrderStatus.PROCESSING,
-            "shipped": OrderStatus.SHIPPED,
-            "delivered": OrderStatus.DELIVERED,
-            "cancelled": OrderStatus.CANCELLED,
-        }.get(order_status.lower(), OrderStatus.SHIPPED)
-
-        can_modify = order_manager.can_modify_order(status_enum)
-        return f"Order can be modified: {can_modify}"
-
-    except Exception as e:
-        return f"Error checking modification: {str(e)}"
+    status_enum = _STATUS_MAP.get(order_status.lower(), OrderStatus.SHIPPED)
+    return f"Order can be modified: {_CAN_MODIFY[status_enum]}"
 
 
 @tool
@@ -352,27 +549,19 @@ def get_delivery_estimate(shipping_speed: str) -> str:
     Returns:
         Estimated delivery time as a formatted string
     """
-    try:
-        speed_map = {
-            "standard": ShippingSpeed.STANDARD,
-            "expedited": ShippingSpeed.EXPEDITED,
-            "express": ShippingSpeed.EXPRESS,
-        }
-        speed_enum = speed_map.get(shipping_speed.lower())
-        if speed_enum is None:
-            valid = ", ".join(speed_map.keys())
-            return f"Invalid shipping speed: '{shipping_speed}'. Valid options are: {valid}"
+    speed_enum = _SPEED_MAP.get(shipping_speed.lower())
+    if speed_enum is None:
+        valid = ", ".join(_SPEED_MAP)
+        return f"Invalid shipping speed: '{shipping_speed}'. Valid options are: {valid}"
 
-        estimate = order_manager.get_delivery_estimate(speed_enum)
-        return f"Estimated delivery time for {shipping_speed.lower()}: {estimate}"
-
-    except Exception as e:
-        return f"Error getting delivery estimate: {str(e)}"
+    estimate = _DELIVERY_ESTIMATE[speed_enum]
+    return f"Estimated delivery time for {shipping_speed.lower()}: {estimate}"
 
 
 def get_tools():
     """Return list of all available tools."""
     return [
+        get_customer_context,
         lookup_order,
         get_customer_orders,
         lookup_customer,
@@ -384,3 +573,38 @@ def get_tools():
         check_can_modify_order,
         get_delivery_estimate,
     ]
+
+
+# Tool name -> undecorated implementation, used by run_tools_batch
+_DISPATCH = {t.name: t.func for t in get_tools()}
+
+
+def run_tools_batch(specs: list[dict]) -> list[str]:
+    """
+    Run several tool calls in one go, bypassing the LangChain tool wrappers.
+
+    Intended for offline evaluation code only; the agent itself invokes the
+    tools. Arguments are passed straight to the implementations without schema
+    validation, so they must already have the right types.
+
+    Args:
+        specs: Tool calls as {"name": ..., "args": {...}} dicts, the same shape
+            as a model response's tool_calls
+
+    Returns:
+        Each call's result string, in the order of specs
+    """
+    results = []
+    for spec in specs:
+        name = spec.get("name")
+        func = _DISPATCH.get(name)
+        if func is None:
+            results.append(f"Tool {name} not found")
+            continue
+        # Same error text as the agent's tool calls; one bad spec doesn't
+        # discard the rest of the batch
+        try:
+            results.append(func(**spec.get("args", {})))
+        except Exception as e:
+            results.append(f"Error calling tool: {str(e)}")
+    return results